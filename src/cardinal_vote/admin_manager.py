@@ -244,6 +244,10 @@ class AdminManager:
         return sorted(logos, key=lambda x: x["filename"])
 
     # Vote Management Methods
+    def get_vote(self, vote_id: int) -> dict[str, Any] | None:
+        """Get a single vote by its ID, or None if it does not exist."""
+        return self.db_manager.get_vote_by_id(vote_id)
+
     def delete_single_vote(self, vote_id: int) -> dict[str, Any]:
         """
         Delete a single vote by its ID.
@@ -372,10 +376,10 @@ class AdminManager:
         """
         try:
             with self.db_manager.get_session() as session:
-                votes_to_delete = (
-                    session.query(VoteRecord).filter_by(voter_name=voter_name).all()
+                # Bulk delete in one statement; the row count tells us if any matched
+                vote_count = (
+                    session.query(VoteRecord).filter_by(voter_name=voter_name).delete()
                 )
-                vote_count = len(votes_to_delete)
 
                 if vote_count == 0:
                     return {
@@ -383,8 +387,6 @@ class AdminManager:
                         "message": f"No votes found for voter '{voter_name}'",
                     }
 
-                # Delete the votes
-                session.query(VoteRecord).filter_by(voter_name=voter_name).delete()
                 session.commit()
 
             logger.info(f"Deleted {vote_count} votes for voter: {voter_name}")
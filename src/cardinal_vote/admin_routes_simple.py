@@ -25,6 +25,9 @@ logger = logging.getLogger(__name__)
 # Router for all admin endpoints
 admin_router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Largest value SQLite can store in an INTEGER primary key
+_MAX_SQLITE_INTEGER = 2**63 - 1
+
 # Global variables (will be set by main.py)
 templates: Jinja2Templates | None = None
 auth_manager: AdminAuthManager | None = None
@@ -73,6 +76,17 @@ def get_admin_user_or_error(request: Request) -> dict:
     return user_info
 
 
+def parse_vote_id(vote_id: str) -> int | None:
+    """Parse a vote ID path parameter, returning None if it is not a valid ID."""
+    if not vote_id.isdigit():
+        return None
+    try:
+        vote_id_int = int(vote_id)
+    except ValueError:
+        return None
+    return vote_id_int if vote_id_int <= _MAX_SQLITE_INTEGER else None
+
+
 @admin_router.get("/login", response_class=HTMLResponse)
 async def admin_login_page(request: Request) -> Response:
     """Serve admin login page."""
@@ -429,16 +443,10 @@ async def get_vote_details(request: Request, vote_id: str) -> JSONResponse:
                 status_code=401,
             )
 
-        # Get all votes and find the specific one by ID
+        # Look the vote up directly by its primary key
         assert admin_manager is not None
-        votes = admin_manager.get_recent_activity(limit=1000)
-
-        # Find vote by ID
-        vote = None
-        for v in votes:
-            if str(v.get("id")) == str(vote_id):
-                vote = v
-                break
+        vote_id_int = parse_vote_id(vote_id)
+        vote = admin_manager.get_vote(vote_id_int) if vote_id_int is not None else None
 
         if vote:
             return JSONResponse({"success": True, "vote": vote})
@@ -463,9 +471,8 @@ async def delete_vote(request: Request, vote_id: str) -> JSONResponse:
         admin_user = get_admin_user_or_error(request)
 
         # Convert vote_id to integer
-        try:
-            vote_id_int = int(vote_id)
-        except ValueError:
+        vote_id_int = parse_vote_id(vote_id)
+        if vote_id_int is None:
             return JSONResponse(
                 {"success": False, "message": "Invalid vote ID format"}, status_code=400
             )
@@ -99,7 +99,9 @@ class Settings:
     )
 
     # File upload settings (updated for generalized platform)
-    ALLOWED_UPLOAD_EXTENSIONS: set[str] = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+    ALLOWED_UPLOAD_EXTENSIONS: frozenset[str] = frozenset(
+        {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+    )
     UPLOAD_TEMP_DIR: Path = BASE_DIR / "temp_uploads"
 
     @property
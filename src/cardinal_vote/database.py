@@ -165,34 +165,7 @@ class DatabaseManager:
                     session.query(VoteRecord).order_by(desc(VoteRecord.timestamp)).all()
                 )
 
-                result = []
-                for vote in votes:
-                    # Handle both new format (first/last name) and legacy format (single name)
-                    if hasattr(vote, "voter_first_name") and vote.voter_first_name:
-                        voter_name = f"{vote.voter_first_name} {vote.voter_last_name}"
-                        first_name = vote.voter_first_name
-                        last_name = vote.voter_last_name
-                    else:
-                        voter_name = vote.voter_name or "Unknown"
-                        # Try to split legacy name for backward compatibility
-                        name_parts = voter_name.split(" ", 1)
-                        first_name = (
-                            name_parts[0] if len(name_parts) > 0 else voter_name
-                        )
-                        last_name = name_parts[1] if len(name_parts) > 1 else ""
-
-                    result.append(
-                        {
-                            "id": vote.id,
-                            "voter_name": voter_name,
-                            "voter_first_name": first_name,
-                            "voter_last_name": last_name,
-                            "timestamp": vote.timestamp.isoformat()
-                            if vote.timestamp
-                            else "",
-                            "ratings": json.loads(vote.ratings or "{}"),
-                        }
-                    )
+                result = [self._vote_to_dict(vote) for vote in votes]
 
                 logger.info(f"Retrieved {len(result)} votes from database")
                 return result
@@ -200,6 +173,40 @@ class DatabaseManager:
             logger.error(f"Failed to retrieve votes: {e}")
             raise DatabaseError(f"Failed to retrieve votes: {e}") from e
 
+    def get_vote_by_id(self, vote_id: int) -> dict[str, Any] | None:
+        """Retrieve a single vote by its ID."""
+        try:
+            with self.get_session() as session:
+                vote = session.get(VoteRecord, vote_id)
+                return self._vote_to_dict(vote) if vote else None
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to retrieve vote {vote_id}: {e}")
+            raise DatabaseError(f"Failed to retrieve vote: {e}") from e
+
+    @staticmethod
+    def _vote_to_dict(vote: VoteRecord) -> dict[str, Any]:
+        """Convert a vote record into its API dictionary form."""
+        # Handle both new format (first/last name) and legacy format (single name)
+        if hasattr(vote, "voter_first_name") and vote.voter_first_name:
+            voter_name = f"{vote.voter_first_name} {vote.voter_last_name}"
+            first_name = vote.voter_first_name
+            last_name = vote.voter_last_name
+        else:
+            voter_name = vote.voter_name or "Unknown"
+            # Try to split legacy name for backward compatibility
+            name_parts = voter_name.split(" ", 1)
+            first_name = name_parts[0] if len(name_parts) > 0 else voter_name
+            last_name = name_parts[1] if len(name_parts) > 1 else ""
+
+        return {
+            "id": vote.id,
+            "voter_name": voter_name,
+            "voter_first_name": first_name,
+            "voter_last_name": last_name,
+            "timestamp": vote.timestamp.isoformat() if vote.timestamp else "",
+            "ratings": json.loads(vote.ratings or "{}"),
+        }
+
     def get_vote_count(self) -> int:
         """Get the total number of votes."""
         try:
@@ -273,11 +280,19 @@ class DatabaseManager:
             logger.error(f"Failed to delete vote {vote_id}: {e}")
             raise DatabaseError(f"Failed to delete vote: {e}") from e
 
+    def close(self) -> None:
+        """Close the database engine and all connections."""
+        try:
+            self.engine.dispose()
+            logger.info("Database engine disposed successfully")
+        except Exception as e:
+            logger.error(f"Error disposing database engine: {e}")
+
     def health_check(self) -> bool:
         """Check if database is accessible."""
         try:
-            with self.get_session() as session:
-                session.execute(text("SELECT 1"))
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
                 return True
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -76,10 +76,8 @@ class GeneralizedDatabaseManager:
     async def health_check(self) -> bool:
         """Check if database is accessible."""
         try:
-            from sqlalchemy import text
-
-            async with self.get_session() as session:
-                await session.execute(text("SELECT 1"))
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
                 return True
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -106,8 +106,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             # Setup admin router with dependencies
             setup_admin_router(templates, admin_auth_manager, admin_manager)
 
-            # Include admin router only in legacy mode
-            app.include_router(admin_router)  # Legacy admin router
+            # Include admin router only in legacy mode, and only once even if
+            # the lifespan runs again on the same app instance
+            if not getattr(app.state, "admin_router_included", False):
+                app.include_router(admin_router)  # Legacy admin router
+                app.state.admin_router_included = True
 
             # Initialize generalized platform managers
             generalized_db_manager = GeneralizedDatabaseManager()
@@ -141,6 +144,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Application shutting down")
+    if db_manager is not None:
+        db_manager.close()
+    if generalized_db_manager is not None:
+        await generalized_db_manager.close()
 
 
 def get_db_manager() -> DatabaseManager:
@@ -451,14 +458,11 @@ async def get_logos_api() -> LogoListResponse:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Aucun logo trouvé"
             )
 
-        # Randomize order for each request
-        randomized_logos = logo_files.copy()
-        random.shuffle(randomized_logos)
+        # Randomize order for each request (get_logo_files returns a fresh list)
+        random.shuffle(logo_files)
 
-        logger.info(f"Returning {len(randomized_logos)} randomized logos")
-        return LogoListResponse(
-            logos=randomized_logos, total_count=len(randomized_logos)
-        )
+        logger.info(f"Returning {len(logo_files)} randomized logos")
+        return LogoListResponse(logos=logo_files, total_count=len(logo_files))
 
     except HTTPException:
         raise
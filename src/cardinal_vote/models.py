@@ -1,5 +1,6 @@
 """Database models for the ToVéCo voting platform."""
 
+import re
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -26,6 +27,9 @@ from .config import settings
 
 Base: DeclarativeMeta = declarative_base()
 
+# Letters, digits, hyphens and underscores only
+_SLUG_PATTERN = re.compile(r"[\w-]*")
+
 
 class VoteRecord(Base):
     """SQLAlchemy model for storing vote records."""
@@ -511,7 +515,7 @@ class VoteCreate(BaseModel):
         if v is not None:
             v = v.strip().lower().replace(" ", "-")
             # Basic slug validation - only alphanumeric and hyphens
-            if not all(c.isalnum() or c in "-_" for c in v):
+            if not _SLUG_PATTERN.fullmatch(v):
                 raise ValueError(
                     "Slug can only contain letters, numbers, hyphens, and underscores"
                 )
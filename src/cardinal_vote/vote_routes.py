@@ -34,6 +34,10 @@ logger = logging.getLogger(__name__)
 # Create router
 vote_router = APIRouter(prefix="/api/votes", tags=["Votes"])
 
+# Precompiled slug patterns
+_SLUG_INVALID_CHARS = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[-\s]+")
+
 
 # Utility functions
 def generate_slug(title: str, existing_slugs: set[str] | None = None) -> str:
@@ -48,8 +52,8 @@ def generate_slug(title: str, existing_slugs: set[str] | None = None) -> str:
         A unique URL-safe slug
     """
     # Convert to lowercase and replace spaces with hyphens
-    slug = re.sub(r"[^\w\s-]", "", title.lower())
-    slug = re.sub(r"[-\s]+", "-", slug).strip("-")
+    slug = _SLUG_INVALID_CHARS.sub("", title.lower())
+    slug = _SLUG_SEPARATORS.sub("-", slug).strip("-")
 
     # Truncate if too long
     if len(slug) > 50:
@@ -32,11 +32,7 @@ def test_vote_details_route():
     print(f"\n🔍 Testing vote lookup with ID: {test_vote_id}")
 
     # Simulate the route logic
-    found_vote = None
-    for v in votes:
-        if str(v.get("id")) == test_vote_id:
-            found_vote = v
-            break
+    found_vote = db_manager.get_vote_by_id(int(test_vote_id))
 
     if found_vote:
         print("✅ Successfully found vote:")